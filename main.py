@@ -1,15 +1,21 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from lxml import etree, html
 import json
-import time
 import os
+import time
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 import argparse
 from collections import OrderedDict
+from email.utils import parsedate_to_datetime
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # OrderedDict of Bible books and their number of chapters, in order
 bible_books = OrderedDict([
     ('GEN', 50), ('EXO', 40), ('LEV', 27), ('NUM', 36), ('DEU', 34), 
@@ -27,36 +33,135 @@ bible_books = OrderedDict([
     ('2PE', 3), ('1JN', 5), ('2JN', 1), ('3JN', 1), ('JUD', 1), ('REV', 22)
 ])
 
-# Dictionary mapping Bible versions to their corresponding IDs on bible.com
-bible_versions = {
-'AMP': '1588', 'AMPC': '8', 'ASV': '12', 'BSB': '3034', 'CEB': '37',
-'CEV': '392', 'CEVDCI': '303', 'CEVUK': '294', 'CJB': '1275', 'CPDV': '42',
-'CSB': '1713', 'DARBY': '478', 'DRC1752': '55', 'EASY': '2079', 'ERV': '406',
-'ESV': '59', 'FBV': '1932', 'FNVNT': '3633', 'GNBDC': '416', 'GNBDK': '431',
-'GNBUK': '296', 'GNT': '68', 'GNTD': '69', 'GNV': '2163', 'GW': '70',
-'GWC': '1047', 'HCSB': '72', 'ICB': '1359', 'JUB': '1077', 'KJV': '1',
-'KJVAAE': '546', 'KJVAE': '547', 'LEB': '90', 'LSB': '3345', 'MEV': '1171',
-'MP1650': '1365', 'MP1781': '3051', 'MSG': '97', 'NABRE': '463', 'NASB1995': '100',
-'NASB2020': '2692', 'NCV': '105', 'NET': '107', 'NIRV': '110', 'NIV': '111',
-'NIVUK': '113', 'NKJV': '114', 'NLT': '116', 'NMV': '2135', 'NRSV': '2016',
-'NRSV-CI': '2015', 'NRSVUE': '3523', 'OYBCENGL': '3915', 'PEV': '2530', 'RAD': '2753',
-'RSV': '2020', 'RSV-C': '2017', 'RSVCI': '3548', 'RV1885': '477', 'RV1895': '1922',
-'TCENT': '3427', 'TEG': '3010', 'TLV': '314', 'TOJB2011': '130', 'TPT': '1849',
-'TS2009': '316', 'WBMS': '2407', 'WEBBE': '1204', 'WEBUS': '206', 'WMB': '1209',
-'WMBBE': '1207', 'YLT98': '821'
-}
+# Bible versions and their corresponding IDs on bible.com, as (code, id) pairs
+BIBLE_VERSIONS = (
+    ('AMP', '1588'), ('AMPC', '8'), ('ASV', '12'), ('BSB', '3034'), ('CEB', '37'),
+    ('CEV', '392'), ('CEVDCI', '303'), ('CEVUK', '294'), ('CJB', '1275'), ('CPDV', '42'),
+    ('CSB', '1713'), ('DARBY', '478'), ('DRC1752', '55'), ('EASY', '2079'), ('ERV', '406'),
+    ('ESV', '59'), ('FBV', '1932'), ('FNVNT', '3633'), ('GNBDC', '416'), ('GNBDK', '431'),
+    ('GNBUK', '296'), ('GNT', '68'), ('GNTD', '69'), ('GNV', '2163'), ('GW', '70'),
+    ('GWC', '1047'), ('HCSB', '72'), ('ICB', '1359'), ('JUB', '1077'), ('KJV', '1'),
+    ('KJVAAE', '546'), ('KJVAE', '547'), ('LEB', '90'), ('LSB', '3345'), ('MEV', '1171'),
+    ('MP1650', '1365'), ('MP1781', '3051'), ('MSG', '97'), ('NABRE', '463'), ('NASB1995', '100'),
+    ('NASB2020', '2692'), ('NCV', '105'), ('NET', '107'), ('NIRV', '110'), ('NIV', '111'),
+    ('NIVUK', '113'), ('NKJV', '114'), ('NLT', '116'), ('NMV', '2135'), ('NRSV', '2016'),
+    ('NRSV-CI', '2015'), ('NRSVUE', '3523'), ('OYBCENGL', '3915'), ('PEV', '2530'), ('RAD', '2753'),
+    ('RSV', '2020'), ('RSV-C', '2017'), ('RSVCI', '3548'), ('RV1885', '477'), ('RV1895', '1922'),
+    ('TCENT', '3427'), ('TEG', '3010'), ('TLV', '314'), ('TOJB2011', '130'), ('TPT', '1849'),
+    ('TS2009', '316'), ('WBMS', '2407'), ('WEBBE', '1204'), ('WEBUS', '206'), ('WMB', '1209'),
+    ('WMBBE', '1207'), ('YLT98', '821'),
+)
+DEFAULT_VERSIONS = tuple(code for code, _ in BIBLE_VERSIONS)
+bible_versions = dict(BIBLE_VERSIONS)
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/124.0 Safari/537.36')
+
+# Responses that mean bible.com wants us to slow down, and how many times to retry them
+RETRY_STATUSES = {429, 503}
+MAX_RETRIES = 5
+
+class ConnectionStats:
+    """Counts requests and newly opened connections, to check that keep-alive connections are reused."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+
+    async def on_request(self, request):
+        self.requests += 1
+        request.extensions['trace'] = self.trace
+
+    async def trace(self, event_name, _info):
+        if event_name == 'connection.connect_tcp.complete':
+            self.connections += 1
+
+def create_client(per_host_concurrency=10, stats=None):
+    """Build the shared HTTP/2 client; every chapter request goes to bible.com over its pool."""
+    # All requests go to a single host, so the pool size is the per-host connection budget
+    limits = httpx.Limits(max_connections=per_host_concurrency, max_keepalive_connections=per_host_concurrency)
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+    event_hooks = {'request': [stats.on_request]} if stats is not None else None
+    # No Accept-Encoding override: httpx already offers br (via the httpx[brotli] extra) along with gzip
+    return httpx.AsyncClient(transport=transport, headers={'User-Agent': USER_AGENT},
+                             timeout=30, follow_redirects=True, event_hooks=event_hooks)
+
+class RateLimiter:
+    """Token bucket shared by all requests, allowing `rate` requests per second on average."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def get_retry_delay(response, attempt):
+    """Seconds to wait before retrying, honouring Retry-After and falling back to exponential backoff."""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        if retry_after.isdigit():
+            return int(retry_after)
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    return 2 ** attempt
+
+async def fetch(client, semaphore, limiter, url, headers=None):
+    for attempt in range(MAX_RETRIES + 1):
+        await limiter.acquire()
+        async with semaphore:
+            response = await client.get(url, headers=headers)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            if response.status_code != httpx.codes.NOT_MODIFIED:
+                response.raise_for_status()
+            return response
+        delay = get_retry_delay(response, attempt)
+        logging.warning(f"Got HTTP {response.status_code} for {url}, retrying in {delay:.1f}s.")
+        await asyncio.sleep(delay)
 
 # Setup logging
 logging.basicConfig(filename='bible_scraper.log', level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
+# httpx logs every request at INFO; the scraper already logs each chapter itself
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+def dumps_json(obj, indent=False):
+    """Serialize `obj` to UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+def loads_json(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# progress.json maps version -> book -> chapter -> validators ({"etag": ..., "lm": ...}) of saved chapters
+PROGRESS_FILE = 'progress.json'
+# Append-only log of chapters finished since the last compaction, one JSON object per line
+PROGRESS_LOG = 'progress.jsonl'
 
 def load_progress():
+    progress = {}
     try:
-        if os.path.exists('progress.json'):
-            with open('progress.json', 'r') as f:
+        if os.path.exists(PROGRESS_FILE):
+            with open(PROGRESS_FILE, 'rb') as f:
                 content = f.read().strip()
                 if content:
-                    return json.loads(content)
+                    progress = loads_json(content)
                 else:
                     logging.warning("progress.json is empty. Starting with empty progress.")
         else:
@@ -65,117 +170,242 @@ def load_progress():
         logging.error(f"Error decoding progress.json: {e}. Starting with empty progress.")
     except Exception as e:
         logging.error(f"Unexpected error loading progress: {e}. Starting with empty progress.")
-    return {}
+    replay_progress_log(progress)
+    return progress
+
+def get_book_progress(progress, version, book):
+    """Return the {chapter: validators} entry of a book, upgrading the old consecutive-chapter count."""
+    book_progress = progress.setdefault(version, {}).setdefault(book, {})
+    if isinstance(book_progress, int):
+        book_progress = {str(chapter): {} for chapter in range(1, book_progress + 1)}
+        progress[version][book] = book_progress
+    return book_progress
+
+def replay_progress_log(progress):
+    """Add the chapters recorded in progress.jsonl to `progress`."""
+    try:
+        if not os.path.exists(PROGRESS_LOG):
+            return
+        with open(PROGRESS_LOG, 'rb') as f:
+            for line in f:
+                try:
+                    entry = loads_json(line)
+                except json.JSONDecodeError:
+                    # A line cut short by an interrupted write; everything before it is still valid
+                    continue
+                book_progress = get_book_progress(progress, entry['version'], entry['book'])
+                book_progress[str(entry['chapter'])] = entry.get('validators', {})
+    except Exception as e:
+        logging.error(f"Error reading {PROGRESS_LOG}: {e}")
+
+def log_chapter(version, book, chapter_number, validators):
+    try:
+        entry = {"version": version, "book": book, "chapter": chapter_number, "validators": validators}
+        with open(PROGRESS_LOG, 'ab') as f:
+            f.write(dumps_json(entry) + b"\n")
+    except Exception as e:
+        logging.error(f"Error logging progress for {book} chapter {chapter_number} ({version}): {e}")
 
 def save_progress(progress):
+    """Write a progress.json snapshot; return whether it was saved."""
     try:
-        with open('progress.json', 'w') as f:
-            json.dump(progress, f, indent=2)
+        # Write to a temporary file first so an interrupted save never leaves a truncated progress.json
+        tmp_file = PROGRESS_FILE + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(dumps_json(progress, indent=True))
+        os.replace(tmp_file, PROGRESS_FILE)
         logging.info("Progress saved successfully.")
+        return True
     except Exception as e:
         logging.error(f"Error saving progress: {e}")
+        return False
+
+def compact_progress(progress):
+    """Write `progress` as the new progress.json snapshot and start a new progress.jsonl."""
+    if not save_progress(progress):
+        # Keep the log so the chapters recorded in it are replayed next run
+        return
+    try:
+        if os.path.exists(PROGRESS_LOG):
+            os.remove(PROGRESS_LOG)
+    except Exception as e:
+        logging.error(f"Error removing {PROGRESS_LOG}: {e}")
+
+# Directory name for each book, prefixed with its position in the canon (e.g. '01_GEN')
+BOOK_NUMBERED = {book: f"{i + 1:02d}_{book}" for i, book in enumerate(bible_books)}
 
 def get_numbered_book_name(book):
-    book_number = list(bible_books.keys()).index(book) + 1
-    return f"{book_number:02d}_{book}"
+    return BOOK_NUMBERED[book]
+
+# Verse spans on a chapter page, compiled once instead of on every parse
+VERSE_XPATH = etree.XPath('//span[@data-usfm]')
 
 def clean_verse_text(text):
     # Sử dụng regex để loại bỏ số câu ở đầu chuỗi
     cleaned_text = re.sub(r'^\d+', '', text).strip()
     return cleaned_text
 
-def scrape_bible_chapter(book, chapter_number, version, progress):
+async def scrape_bible_chapter(client, semaphore, limiter, book, chapter_number, version, book_dir,
+                               book_progress, revalidate=False):
+    """Fetch and save one chapter; return True only if a new copy of the chapter was written.
+
+    With `revalidate`, the chapter is already on disk and its saved ETag/Last-Modified are sent so
+    bible.com can answer 304 Not Modified instead of resending the page.
+    """
     version_id = bible_versions.get(version)
     if not version_id:
         logging.error(f"Unknown Bible version: {version}")
         return False
 
     url = f"https://www.bible.com/bible/{version_id}/{book}.{chapter_number}.{version}"
+    headers = {}
+    validators = book_progress.get(str(chapter_number), {}) if revalidate else {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('lm'):
+        headers['If-Modified-Since'] = validators['lm']
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        verses = soup.select('span[data-usfm]')
+        response = await fetch(client, semaphore, limiter, url, headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logging.info(f"{book} chapter {chapter_number} ({version}) is unchanged, skipping.")
+            return False
+        # Captcha and error pages have no verse spans; don't spend a full parse on them
+        if b'data-usfm' not in response.content:
+            logging.warning(f"No verses found for {book} chapter {chapter_number} ({version}), skipping.")
+            return False
+        # Decode with the charset from Content-Type; without a <meta charset> lxml would assume latin-1
+        parser = html.HTMLParser(encoding=response.encoding or 'utf-8')
+        tree = html.fromstring(response.content, parser=parser)
+        verses = VERSE_XPATH(tree)
         
         # Sử dụng một dictionary để lưu trữ câu mới nhất cho mỗi số câu
         verse_dict = {}
         for verse in verses:
-            verse_number = verse['data-usfm'].split('.')[-1]
-            text = clean_verse_text(verse.text.strip())
+            verse_number = verse.get('data-usfm').rpartition('.')[2]
+            text = clean_verse_text(verse.text_content().strip())
             if text or verse_number not in verse_dict:
                 verse_dict[verse_number] = text
 
-        # Chuyển đổi dictionary thành list of dictionaries
+        # Chuyển đổi dictionary thành list of dictionaries, sắp xếp theo thứ tự số câu
         bible_data = [
             {
                 "verse_number": verse_number,
-                "text": text
+                "text": verse_dict[verse_number]
             }
-            for verse_number, text in verse_dict.items()
+            for verse_number in sorted(verse_dict, key=int)
         ]
 
-        # Sắp xếp các câu theo thứ tự số câu
-        bible_data.sort(key=lambda x: int(x['verse_number']))
-
-        # Create directory for the book and version if it doesn't exist
-        numbered_book = get_numbered_book_name(book)
-        book_dir = os.path.join('data', version, numbered_book)
-        os.makedirs(book_dir, exist_ok=True)
         # Save file with new naming convention
         filename = f"{book}_{chapter_number:03d}_{version}.json"
-        with open(os.path.join(book_dir, filename), 'w', encoding='utf-8') as f:
-            json.dump(bible_data, f, ensure_ascii=False, indent=4)
+        with open(os.path.join(book_dir, filename), 'wb') as f:
+            f.write(dumps_json(bible_data, indent=True))
         logging.info(f"{filename} has been scraped, cleaned, and saved in {book_dir}.")
-
-        # Update progress
-        if version not in progress:
-            progress[version] = {}
-        if book not in progress[version]:
-            progress[version][book] = 0
-        progress[version][book] += 1
-        save_progress(progress)
+        validators = {key: value for key, value in (('etag', response.headers.get('ETag')),
+                                                    ('lm', response.headers.get('Last-Modified'))) if value}
+        book_progress[str(chapter_number)] = validators
+        log_chapter(version, book, chapter_number, validators)
 
         return True
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logging.error(f"An error occurred while fetching {book} chapter {chapter_number} ({version}): {e}")
     except Exception as e:
         logging.error(f"An unexpected error occurred with {book} chapter {chapter_number} ({version}): {e}")
     return False
 
-def scrape_book(book, chapters, version, progress):
-    logging.info(f"Scraping {book} ({version})...")
-    completed_chapters = progress.get(version, {}).get(book, 0)
-    newly_downloaded = 0
-    for chapter in range(completed_chapters + 1, chapters + 1):
-        success = scrape_bible_chapter(book, chapter, version, progress)
-        if success:
-            newly_downloaded += 1
-        if not success:
-            logging.warning(f"Skipping remaining chapters of {book} ({version}) due to error.")
-            break
-        time.sleep(2)
-    return newly_downloaded
-
-def scrape_all_bible(versions, max_workers=5):
+def find_missing_chapters(book, chapters, version, progress, refresh=False):
+    """Return the book's data directory, the chapters already saved there and the chapters to fetch.
+
+    Normally only chapters without a saved file are fetched; with `refresh` every chapter is.
+    """
+    book_dir = os.path.join('data', version, get_numbered_book_name(book))
+    book_progress = get_book_progress(progress, version, book)
+
+    # The saved chapter files are the source of truth for what has already been downloaded;
+    # progress.json only keeps the validators of those chapters
+    done = set()
+    if os.path.exists(book_dir):
+        # Only files named like the ones scrape_bible_chapter writes count; anything else is ignored
+        chapter_file = re.compile(rf"{re.escape(book)}_(\d{{3}})_{re.escape(version)}\.json")
+        with os.scandir(book_dir) as entries:
+            for e in entries:
+                match = chapter_file.fullmatch(e.name)
+                if match and e.is_file():
+                    done.add(int(match.group(1)))
+    else:
+        os.makedirs(book_dir, exist_ok=True)
+    for chapter in list(book_progress):
+        if int(chapter) not in done:
+            del book_progress[chapter]
+    for chapter in done:
+        book_progress.setdefault(str(chapter), {})
+
+    if refresh:
+        return book_dir, done, list(range(1, chapters + 1))
+    return book_dir, done, [chapter for chapter in range(1, chapters + 1) if chapter not in done]
+
+def update_book_progress(book, chapters, version, done, progress):
+    """Snapshot progress once every chapter task of a book has finished."""
+    failed = chapters - len(done)
+    if failed:
+        logging.warning(f"{failed} chapters of {book} ({version}) failed and will be retried next run.")
+    save_progress(progress)
+
+async def scrape_all_bible(versions, books=None, per_host_concurrency=10, rps=5, refresh=False):
     progress = load_progress()
+    books = books if books is not None else list(bible_books.keys())
     total_downloaded = {version: 0 for version in versions}
-    total_books = len(bible_books) * len(versions)
-
-    with tqdm(total=total_books, desc="Overall Progress") as pbar:
-        for version in versions:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_book = {executor.submit(scrape_book, book, chapters, version, progress): book 
-                                  for book, chapters in bible_books.items()}
-
-                for future in as_completed(future_to_book):
-                    book = future_to_book[future]
-                    try:
-                        newly_downloaded = future.result()
-                        total_downloaded[version] += newly_downloaded
-                        pbar.update(1)
-                        pbar.set_postfix({"Downloaded": sum(total_downloaded.values())}, refresh=True)
-                    except Exception as exc:
-                        logging.error(f'{book} generated an exception: {exc}')
+    total_chapters = sum(bible_books[book] for book in books) * len(versions)
+    semaphore = asyncio.Semaphore(per_host_concurrency)
+    limiter = RateLimiter(rps)
+    stats = ConnectionStats()
+
+    try:
+        async with create_client(per_host_concurrency, stats) as client:
+            with tqdm(total=total_chapters, desc="Overall Progress", unit="chapter",
+                      mininterval=0.5, miniters=10, smoothing=0.1) as pbar:
+                for version in versions:
+                    # One task per missing chapter across all books, so no book waits behind another
+                    done_by_book = {}
+                    outstanding = {}
+                    task_to_chapter = {}
+                    for book in books:
+                        book_dir, done, to_fetch = find_missing_chapters(book, bible_books[book], version,
+                                                                         progress, refresh)
+                        pbar.update(bible_books[book] - len(to_fetch))
+                        if not to_fetch:
+                            continue
+                        logging.info(f"Scraping {book} ({version})...")
+                        book_progress = get_book_progress(progress, version, book)
+                        done_by_book[book] = done
+                        outstanding[book] = len(to_fetch)
+                        for chapter in to_fetch:
+                            task = asyncio.create_task(
+                                scrape_bible_chapter(client, semaphore, limiter, book, chapter, version, book_dir,
+                                                     book_progress, revalidate=chapter in done))
+                            task_to_chapter[task] = (book, chapter)
+
+                    pending = set(task_to_chapter)
+                    while pending:
+                        finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in finished:
+                            book, chapter = task_to_chapter[task]
+                            try:
+                                if task.result():
+                                    done_by_book[book].add(chapter)
+                                    total_downloaded[version] += 1
+                            except Exception as exc:
+                                logging.error(f'{book} chapter {chapter} generated an exception: {exc}')
+                            outstanding[book] -= 1
+                            if not outstanding[book]:
+                                update_book_progress(book, bible_books[book], version, done_by_book[book], progress)
+                        # One bar update per batch of finished chapters; tqdm redraws at most every mininterval
+                        pbar.set_postfix({"Downloaded": sum(total_downloaded.values())}, refresh=False)
+                        pbar.update(len(finished))
+    finally:
+        # Also runs on Ctrl+C. The in-memory progress already includes the replayed log, the on-disk
+        # pruning from find_missing_chapters and every chapter saved this run, so it becomes the snapshot
+        compact_progress(progress)
+        logging.info(f"Sent {stats.requests} requests over {stats.connections} new connections.")
 
     return total_downloaded
 
@@ -186,44 +416,66 @@ def display_book_order(version):
         print(f"No data found for version {version}")
         return
 
-    books = sorted(os.listdir(version_dir))
+    with os.scandir(version_dir) as entries:
+        books = sorted(e.name for e in entries if e.is_dir())
     print(f"Current order of books for {version}:")
     for book_dir in books:
         print(book_dir)
 
+def positive_float(value):
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description='Scrape Bible chapters from bible.com')
     parser.add_argument('--versions', nargs='+', help='Specific Bible versions to scrape (default: all versions)')
-    parser.add_argument('--workers', type=int, default=5, help='Number of worker threads (default: 5)')
+    parser.add_argument('--per-host-concurrency', '--workers', dest='per_host_concurrency', type=positive_int,
+                        default=10, help='Maximum number of in-flight requests to bible.com (default: 10)')
+    parser.add_argument('--rps', type=positive_float, default=5,
+                        help='Maximum requests per second to bible.com (default: 5)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-check already downloaded chapters, skipping unchanged ones via ETag/Last-Modified')
     parser.add_argument('--books', nargs='+', help='Specific books to scrape (e.g., GEN EXO LEV)')
     parser.add_argument('--display-order', action='store_true', help='Display the current order of books in data directory')
     args = parser.parse_args()
 
-    # If no specific versions are provided, use all versions from bible_versions
-    versions_to_scrape = args.versions if args.versions else list(bible_versions.keys())
+    # If no specific versions are provided, use all versions from BIBLE_VERSIONS
+    versions_to_scrape = args.versions if args.versions else DEFAULT_VERSIONS
 
     if args.display_order:
         for version in versions_to_scrape:
             display_book_order(version)
         return
 
-    progress = load_progress()
-    total_downloaded = {version: 0 for version in versions_to_scrape}
+    # Drop unknown versions up front so no directories or progress entries are created for them
+    # (duplicates are dropped too: per-version and per-book state is keyed by name)
+    valid_versions = []
+    for version in dict.fromkeys(versions_to_scrape):
+        if version in bible_versions:
+            valid_versions.append(version)
+        else:
+            logging.warning(f"Unknown Bible version: {version}")
+    versions_to_scrape = valid_versions
 
+    books_to_scrape = None
     if args.books:
-        total_books = len(args.books) * len(versions_to_scrape)
-        with tqdm(total=total_books, desc="Overall Progress") as pbar:
-            for version in versions_to_scrape:
-                for book in args.books:
-                    if book in bible_books:
-                        newly_downloaded = scrape_book(book, bible_books[book], version, progress)
-                        total_downloaded[version] += newly_downloaded
-                        pbar.update(1)
-                        pbar.set_postfix({"Downloaded": sum(total_downloaded.values())}, refresh=True)
-                    else:
-                        logging.warning(f"Unknown book: {book}")
-    else:
-        total_downloaded = scrape_all_bible(versions_to_scrape, args.workers)
+        books_to_scrape = []
+        for book in dict.fromkeys(args.books):
+            if book in bible_books:
+                books_to_scrape.append(book)
+            else:
+                logging.warning(f"Unknown book: {book}")
+
+    total_downloaded = asyncio.run(scrape_all_bible(versions_to_scrape, books_to_scrape,
+                                                    args.per_host_concurrency, args.rps, args.refresh))
 
     # Display the order of books after scraping
     for version in versions_to_scrape: